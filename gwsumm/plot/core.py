@@ -806,22 +806,26 @@ class DataPlot(SummaryPlot):
         return outputfile
 
     def apply_parameters(self, *axes, **pargs):
-        keys = sorted(list(pargs),
-                      key=lambda x: 1 if x in ('xscale', 'yscale') else 2)
+        # parse parameters once, then apply them to each of the axes
+        params = []
+        for key in sorted(list(pargs),
+                          key=lambda x: 1 if x in ('xscale', 'yscale') else 2):
+            if key.startswith('no-'):  # skip no-xxx keys
+                continue
+            val = pargs[key]
+            if key in ['xlim', 'ylim'] and isinstance(val, str):
+                val = eval(val)
+            params.append((key, 'set_%s' % key, val))
         for ax in axes:
-            for key in keys:
-                if key.startswith('no-'):  # skip no-xxx keys
-                    continue
-                val = pargs[key]
-                if key in ['xlim', 'ylim'] and isinstance(val, str):
-                    val = eval(val)
-                elif key == 'grid':
+            for key, setter, val in params:
+                if key == 'grid':
                     self._apply_grid_params(ax, val)
                     continue
-                try:
-                    getattr(ax, 'set_%s' % key)(val)
-                except AttributeError:
+                func = getattr(ax, setter, None)
+                if func is None:
                     setattr(ax, key, val)
+                else:
+                    func(val)
 
     def _apply_grid_params(self, ax, val):
         if val in ('major', 'minor'):
@@ -19,11 +19,14 @@
 """Definitions for event trigger plots
 """
 
-import re
 from collections import OrderedDict
-from itertools import cycle
+from math import ceil
+from functools import lru_cache
+from itertools import (cycle, islice)
 
-from numpy import isinf
+import numpy
+
+from matplotlib.cm import ScalarMappable
 
 from astropy.units import Quantity
 
@@ -31,6 +34,8 @@ from gwpy.detector import (Channel, ChannelList)
 from gwpy.plot.gps import GPSTransform
 from gwpy.plot.utils import (color_cycle, marker_cycle)
 from gwpy.segments import SegmentList
+from gwpy.table.filter import parse_operator
+from gwpy.timeseries import TimeSeries
 
 from gwdetchar.plot import texify
 
@@ -38,7 +43,7 @@ from ... import globalv
 from ...channels import get_channel
 from ...data import (get_timeseries, add_timeseries)
 from ..registry import (get_plot, register_plot)
-from ...triggers import (get_triggers, get_time_column)
+from ...triggers import (get_triggers_in_segments, get_time_column)
 from ...utils import re_cchar
 from ..utils import (get_column_string, hash)
 
@@ -52,6 +57,63 @@ LATEX_OPERATOR = {
 }
 
 
+@lru_cache(maxsize=None)
+def _sanitize(token):
+    """Format a string for use in a plot ID (upper-case, no special chars)
+    """
+    return re_cchar.sub('_', str(token)).upper()
+
+
+def _event_rates(table, stride, start, end, timecolumn, column=None,
+                 bins=None, operator='>='):
+    """Calculate the event rate of a table, optionally binned by a column
+
+    This reproduces `EventTable.event_rate` and
+    `EventTable.binned_event_rates`, but makes one filtered copy of the
+    time column per bin instead of a full table copy.
+
+    Returns
+    -------
+    rates : `list` of `~gwpy.timeseries.TimeSeries`
+        one rate for each bin, or a single rate if ``column`` is not given
+    """
+    times = numpy.asarray(table[timecolumn])
+    if times.dtype.name == 'object':  # cast to ufuncable type
+        times = times.astype('longdouble', copy=False)
+    nsamp = int(ceil((end - start) / stride))
+    timebins = numpy.arange(nsamp + 1) * stride + start
+
+    def _rate(keep=None, name='Event rate'):
+        counts = numpy.histogram(
+            times if keep is None else times[keep], bins=timebins)[0]
+        return TimeSeries(counts / float(stride), t0=start, dt=stride,
+                          unit='Hz', name=name)
+
+    if column is None:
+        return [_rate()]
+
+    # generate column bins
+    if not bins:
+        bins = [(-numpy.inf, numpy.inf)]
+    if operator == 'in' and not isinstance(bins[0], tuple):
+        bins = [(bin_, bins[i+1]) for i, bin_ in enumerate(bins[:-1])]
+    elif isinstance(operator, str):
+        op_func = parse_operator(operator)
+    else:
+        op_func = operator
+    coldata = numpy.asarray(table[column])
+
+    rates = []
+    for bin_ in bins:
+        if isinstance(bin_, tuple):
+            keep = (coldata >= bin_[0]) & (coldata < bin_[1])
+        else:
+            keep = op_func(coldata, bin_)
+        rates.append(_rate(keep, name=' '.join(
+            (column, str(operator), str(bin_)))))
+    return rates
+
+
 class TriggerPlotMixin(object):
     """Mixin to overwrite `channels` property for trigger plots
 
@@ -65,7 +127,8 @@ class TriggerPlotMixin(object):
     def allchannels(self):
         """List of all unique channels for this plot
         """
-        chans = set([re.split(r'[#@]', str(c), 1)[0] for c in self._channels])
+        chans = set([str(c).partition('#')[0].partition('@')[0]
+                     for c in self._channels])
         return ChannelList(map(Channel, chans))
 
     @property
@@ -80,7 +143,25 @@ class TriggerPlotMixin(object):
             if self.filterstr:
                 filts += self.filterstr
             self._pid = hash(chans + filts)
-            return self.pid
+            return self._pid
+
+    def _get_tables(self, channels, segments):
+        """Get the trigger table for each channel within some segments
+
+        Tables are taken from the global memory (no new triggers are read),
+        and are filtered using the ``filterstr`` for this plot.
+        """
+        statestr = str(self.state) if self.state else 'All'
+        tables = []
+        for channel in channels:
+            key = str(channel)
+            if '#' in key or '@' in key:
+                key = '%s,%s' % (key, statestr)
+            table = get_triggers_in_segments(key, self.etg, segments)
+            if self.filterstr is not None:
+                table = table.filter(self.filterstr)
+            tables.append(table)
+        return tables
 
 
 class TriggerDataPlot(TriggerPlotMixin, TimeSeriesDataPlot):
@@ -104,6 +185,8 @@ class TriggerDataPlot(TriggerPlotMixin, TimeSeriesDataPlot):
         'logcolor': False,
         'colorlabel': None,
     })
+    _plotarg_keys = ('vmin', 'vmax', 'edgecolor', 'facecolor', 'cmap', 's',
+                     'marker', 'rasterized', 'sortbycolor')
 
     def __init__(self, channels, start, end, state=None, outdir='.',
                  etg=None, **kwargs):
@@ -125,13 +208,13 @@ class TriggerDataPlot(TriggerPlotMixin, TimeSeriesDataPlot):
         try:
             return self._pid
         except AttributeError:
-            super(TriggerDataPlot, self).pid
-            self._pid += '_%s' % re_cchar.sub('_', self.etg)
+            pid = super(TriggerDataPlot, self).pid.upper()
+            pid += '_%s' % _sanitize(self.etg)
             for column in self.columns:
                 if column:
-                    self._pid += '_%s' % re_cchar.sub('_', str(column))
-            self._pid = self._pid.upper()
-            return self.pid
+                    pid += '_%s' % _sanitize(column)
+            self._pid = pid
+            return pid
 
     @pid.setter
     def pid(self, id_):
@@ -160,70 +243,71 @@ class TriggerDataPlot(TriggerPlotMixin, TimeSeriesDataPlot):
         no_loudest = self.pargs.pop('no-loudest', False) is not False
         loudest_by = self.pargs.pop('loudest-by', None)
 
-        # get plot arguments
-        plotargs = []
-        for i in range(len(self.channels)):
-            plotargs.append(dict())
-        # get plot arguments
-        for key in ['vmin', 'vmax', 'edgecolor', 'facecolor', 'cmap', 's',
-                    'marker', 'rasterized', 'sortbycolor']:
-            try:
-                val = self.pargs.pop(key)
-            except KeyError:
-                continue
-            if key == 'facecolor' and len(self.channels) > 1 and val is None:
+        # get plot arguments (one list of per-channel values for each key)
+        nchan = len(self.channels)
+        plotargs = {key: self.pargs.pop(key) for key in self._plotarg_keys
+                    if key in self.pargs}
+        for key, val in plotargs.items():
+            if key == 'facecolor' and nchan > 1 and val is None:
                 val = color_cycle()
-            if key == 'marker' and len(self.channels) > 1 and val is None:
+            if key == 'marker' and nchan > 1 and val is None:
                 val = marker_cycle()
-            elif isinstance(val, (list, tuple, cycle)):
-                val = cycle(val)
-            else:
-                val = cycle([val] * len(self.channels))
-            for i in range(len(self.channels)):
-                plotargs[i][key] = next(val)
+            elif not isinstance(val, (list, tuple, cycle)):
+                val = [val]
+            plotargs[key] = list(islice(cycle(val), nchan))
+
+        # map axis limits to the channel parameters that can set them
+        rangeparams = []
+        for c, column in zip(('x', 'y', 'c'), (xcolumn, ycolumn, ccolumn)):
+            if not column:
+                continue
+            # hack for SnglBurst frequency nonsense
+            if column in ['peak_frequency', 'central_freq']:
+                column = 'frequency'
+            rangeparams.append(('%slim' % c, '%s_range' % column))
 
-        # add data
+        # get data
         valid = SegmentList([self.span])
         if self.state and not self.all_data:
             valid &= self.state.active
-        ntrigs = 0
-        for channel, label, pargs in zip(self.channels, labels, plotargs):
+        channels = []
+        for channel in self.channels:
             try:
-                channel = get_channel(channel)
+                channels.append(get_channel(channel))
             except ValueError:
-                pass
-            if '#' in str(channel) or '@' in str(channel):
-                key = '%s,%s' % (str(channel),
-                                 self.state and str(self.state) or 'All')
-            else:
-                key = str(channel)
-            table = get_triggers(key, self.etg, valid, query=False)
-            if self.filterstr is not None:
-                table = table.filter(self.filterstr)
+                channels.append(channel)
+        ntrigs = 0
+        tables = []
+        for channel, label, table in zip(
+                channels, labels, self._get_tables(channels, valid)):
             ntrigs += len(table)
             # access channel parameters for limits
-            for c, column in zip(('x', 'y', 'c'), (xcolumn, ycolumn, ccolumn)):
-                if not column:
+            for lim, param in rangeparams:
+                val = getattr(channel, param, None)
+                if val is None:
                     continue
-                # hack for SnglBurst frequency nonsense
-                if column in ['peak_frequency', 'central_freq']:
-                    column = 'frequency'
                 # set x and y in plotargs
-                param = '%s_range' % column
-                lim = '%slim' % c
-                if (getattr(channel, param, None) is not None
-                        and c in ('x', 'y')):
-                    self.pargs.setdefault(lim, getattr(channel, param))
+                if lim != 'clim':
+                    self.pargs.setdefault(lim, val)
                     if isinstance(self.pargs[lim], Quantity):
                         self.pargs[lim] = self.pargs[lim].value
                 # set clim separately
-                elif hasattr(channel, param):
-                    if not clim:
-                        clim = getattr(channel, param)
+                elif not clim:
+                    clim = val
+                    if isinstance(clim, Quantity):
+                        clim = tuple(clim.value)
+            tables.append((table, label))
 
+        # add data
+        uselegend = len(self.channels) > 1
+        for i, (table, label) in enumerate(tables):
+            # an empty collection is only needed as a legend entry
+            if not len(table) and not uselegend:
+                continue
             ax.scatter(table[xcolumn], table[ycolumn],
                        c=table[ccolumn] if ccolumn else None,
-                       label=label, **pargs)
+                       label=label,
+                       **{key: val[i] for key, val in plotargs.items()})
 
         # customise plot
         legendargs = self.parse_legend_kwargs(markerscale=3)
@@ -239,14 +323,17 @@ class TriggerDataPlot(TriggerPlotMixin, TimeSeriesDataPlot):
         self.apply_parameters(ax, **self.pargs)
 
         # correct log-scale empty axes
-        if any(map(isinf, ax.get_ylim())):
+        if not numpy.isfinite(ax.get_ylim()).all():
             ax.set_ylim(0.1, 10)
 
         # add colorbar
         if ccolumn:
-            if not ntrigs:
-                ax.scatter([1], [1], c=[1], visible=False)
-            ax.colorbar(cmap=cmap, clim=clim, norm=cnorm, label=clabel)
+            mappable = None
+            if not ntrigs:  # map to a placeholder, not a dummy collection
+                mappable = ScalarMappable()
+                mappable.set_array([1])
+            ax.colorbar(mappable=mappable, cmap=cmap, clim=clim, norm=cnorm,
+                        label=clabel)
 
         if len(self.channels) == 1 and len(table) and not no_loudest:
             columns = [x for x in
@@ -254,7 +341,7 @@ class TriggerDataPlot(TriggerPlotMixin, TimeSeriesDataPlot):
                         ccolumn) if x is not None]
             self.add_loudest_event(ax, table, *columns, fontsize='large')
 
-        if len(self.channels) > 1:
+        if uselegend:
             ax.legend(**legendargs)
 
         # add state segments
@@ -350,12 +437,13 @@ class TriggerTimeSeriesDataPlot(TimeSeriesDataPlot):
         labels = [str(s).strip('\n ') for s in labels]
 
         # add data
+        if self.state and not self.all_data:
+            valid = self.state.active
+        else:
+            valid = SegmentList([self.span])
+        logy = self.logy
         for label, channel in zip(labels, self.channels):
             label = texify(label)
-            if self.state and not self.all_data:
-                valid = self.state.active
-            else:
-                valid = SegmentList([self.span])
             data = get_timeseries(channel, valid, query=False)
             # handle no timeseries
             if not len(data):
@@ -364,9 +452,9 @@ class TriggerTimeSeriesDataPlot(TimeSeriesDataPlot):
             # plot time-series
             color = None
             for ts in data:
-                # double-check log scales
-                if self.logy:
-                    ts.value[ts.value == 0] = 1e-100
+                # double-check log scales (integer data can't hold 1e-100)
+                if logy and ts.dtype.kind == 'f':
+                    numpy.copyto(ts.value, 1e-100, where=ts.value == 0)
                 if color is None:
                     line = ax.plot(ts, label=label)[0]
                     color = line.get_color()
@@ -418,11 +506,12 @@ class TriggerHistogramPlot(TriggerPlotMixin, get_plot('histogram')):
         try:
             return self._pid
         except AttributeError:
-            etg = re_cchar.sub('_', self.etg).upper()
-            self._pid = '%s_%s' % (etg, super(TriggerHistogramPlot, self).pid)
+            pid = '%s_%s' % (_sanitize(self.etg),
+                             super(TriggerHistogramPlot, self).pid)
             if self.column:
-                self._pid += '_%s' % re_cchar.sub('_', self.column).upper()
-            return self.pid
+                pid += '_%s' % _sanitize(self.column)
+            self._pid = pid
+            return pid
 
     @pid.setter
     def pid(self, id_):
@@ -440,42 +529,38 @@ class TriggerHistogramPlot(TriggerPlotMixin, get_plot('histogram')):
         legendargs = self.parse_legend_kwargs()
 
         # add data
-        data = []
-        livetime = []
+        if self.state and not self.all_data:
+            valid = self.state.active
+        else:
+            valid = SegmentList([self.span])
+        channels = []
         for channel in self.channels:
             try:
-                channel = get_channel(channel)
+                channels.append(get_channel(channel))
             except ValueError:
-                pass
-            if self.state and not self.all_data:
-                valid = self.state.active
-            else:
-                valid = SegmentList([self.span])
-            if '#' in str(channel) or '@' in str(channel):
-                key = '%s,%s' % (str(channel),
-                                 self.state and str(self.state) or 'All')
-            else:
-                key = str(channel)
-            table_ = get_triggers(key, self.etg, valid, query=False)
-            if self.filterstr is not None:
-                table_ = table_.filter(self.filterstr)
-            livetime.append(float(abs(table_.meta['segments'])))
-            data.append(table_[self.column])
+                channels.append(channel)
+        data = []
+        for channel, table_ in zip(channels,
+                                   self._get_tables(channels, valid)):
+            data.append(numpy.asarray(table_[self.column]))
             # allow channel data to set parameters
             if hasattr(channel, 'amplitude_range'):
                 self.pargs.setdefault('xlim', channel.amplitude_range)
 
+        # set range if not given (common to all datasets)
+        if any(pargs.get('range') is None for pargs in histargs):
+            range_ = self._get_range(
+                numpy.concatenate(data),
+                # use range from first dataset if given
+                range=histargs[0].get('range'),
+                # use xlim if manually set (user or INI)
+                xlim=None if ax.get_autoscalex_on() else ax.get_xlim(),
+            )
+
         # plot
-        for arr, d, pargs in zip(data, livetime, histargs):
-            # set range if not given
+        for arr, pargs in zip(data, histargs):
             if pargs.get('range') is None:
-                pargs['range'] = self._get_range(
-                    d,
-                    # use range from first dataset if already calculated
-                    range=histargs[0].get('range'),
-                    # use xlim if manually set (user or INI)
-                    xlim=None if ax.get_autoscalex_on() else ax.get_xlim(),
-                )
+                pargs['range'] = range_
             pargs.setdefault('label', None)
             if pargs.get('log', True):
                 pargs.setdefault('bottom', 1e-200)
@@ -534,10 +619,11 @@ class TriggerRateDataPlot(TriggerPlotMixin, TimeSeriesDataPlot):
         try:
             return self._pid
         except AttributeError:
-            etg = re_cchar.sub('_', self.etg).upper()
-            pid = '%s_%s' % (etg, super(TriggerRateDataPlot, self).pid)
+            pid = '%s_%s' % (_sanitize(self.etg),
+                             super(TriggerRateDataPlot, self).pid)
             if self.column:
-                self.pid += '_%s' % re_cchar.sub('_', self.column).upper()
+                pid += '_%s' % _sanitize(self.column)
+            self._pid = pid
             return pid
 
     @pid.setter
@@ -566,10 +652,8 @@ class TriggerRateDataPlot(TriggerPlotMixin, TimeSeriesDataPlot):
         if isinstance(labels, str):
             labels = labels.split(',')
         elif labels is None and self.column and len(self.channels) > 1:
-            labels = []
-            for channel, bin_ in [(c, b) for c in self.channels for b in bins]:
-                labels.append(r' '.join([channel, '$%s$' % opstr,
-                                         str(bin_)]))
+            labels = [r' '.join([str(c), '$%s$' % opstr, str(b)])
+                      for c in self.channels for b in bins]
             self.pargs.setdefault('legend-title', cname)
         elif labels is None and self.column:
             labels = [r' '.join(['$%s$' % opstr, str(b)]) for b in bins]
@@ -582,28 +666,21 @@ class TriggerRateDataPlot(TriggerPlotMixin, TimeSeriesDataPlot):
         tcol = self.pargs.pop('timecolumn', None)
 
         # generate data
+        if self.state and not self.all_data:
+            valid = self.state.active
+        else:
+            valid = SegmentList([self.span])
         keys = []
-        for channel in self.channels:
-            if self.state and not self.all_data:
-                valid = self.state.active
-            else:
-                valid = SegmentList([self.span])
-            if '#' in str(channel) or '@' in str(channel):
-                key = '%s,%s' % (str(channel),
-                                 str(self.state) if self.state else 'All')
-            else:
-                key = str(channel)
-            table_ = get_triggers(key, self.etg, valid, query=False)
-            if self.filterstr is not None:
-                table_ = table_.filter(self.filterstr)
+        for channel, table_ in zip(self.channels,
+                                   self._get_tables(self.channels, valid)):
             tcol_ = tcol or get_time_column(table_, self.etg)
             if self.column:
-                rates = list(table_.binned_event_rates(
-                    stride, self.column, bins, operator=operator,
-                    start=self.start, end=self.end, timecolumn=tcol_).values())
+                rates = _event_rates(
+                    table_, stride, self.start, self.end, tcol_,
+                    column=self.column, bins=bins, operator=operator)
             else:
-                rates = [table_.event_rate(stride, start=self.start,
-                                           end=self.end, timecolumn=tcol_)]
+                rates = _event_rates(table_, stride, self.start, self.end,
+                                     tcol_)
             for bin, rate in zip(bins, rates):
                 rate.channel = channel
                 keys.append('%s_%s_EVENT_RATE_%s_%s'
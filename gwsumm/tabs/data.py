@@ -61,7 +61,7 @@ from ..data.utils import get_fftparams
 from ..plot import get_plot
 from ..segments import get_segments
 from ..state import (generate_all_state, ALLSTATE, get_state)
-from ..triggers import get_triggers
+from ..triggers import (get_triggers, clear_segment_cache)
 from ..utils import (re_flagdiv, vprint, safe_eval)
 
 from .registry import (get_tab, register_tab)
@@ -583,6 +583,9 @@ class DataTab(ProcessedTab, ParentTab):
                    % (len(parallel), nproc))
             multiprocess_with_queues(nproc, lambda p: p.process(), parallel)
 
+        # release segment-filtered trigger copies made for these plots
+        clear_segment_cache()
+
         # record that we have written all of these plots
         globalv.WRITTEN_PLOTS.extend(p.outputfile for p in serial + parallel)
 
@@ -20,17 +20,22 @@
 
 """
 
+import operator
 import os
 import pytest
 
+from numpy import (random, testing as nptest)
+
 from configparser import ConfigParser
 
 from gwpy.detector import ChannelList
 from gwpy.plot import Plot
 from gwpy.plot.tex import has_tex
 from gwpy.segments import Segment
+from gwpy.table import EventTable
 
 from .. import plot as gwsumm_plot
+from ..plot.triggers.core import _event_rates
 from ..channels import get_channel
 
 from matplotlib import use
@@ -345,3 +350,54 @@ class TestDataPlot(TestSummaryPlot):
             'grid': False,
         })
         assert ax.get_xlim() == (10, 20)
+
+
+# -- gwsumm.plot.triggers -----------------------------------------------------
+
+def _create_rate_table(n):
+    rng = random.default_rng(0)
+    return EventTable([rng.uniform(0, 100, n), rng.uniform(0, 50, n)],
+                      names=['time', 'snr'])
+
+
+def _assert_rates_equal(rates, expected):
+    assert len(rates) == len(expected)
+    for rate, exp in zip(rates, expected):
+        nptest.assert_array_equal(rate.value, exp.value)
+        assert rate.name == exp.name
+        assert rate.t0 == exp.t0
+        assert rate.dt == exp.dt
+        assert rate.unit == exp.unit
+
+
+@pytest.mark.parametrize('n', [0, 1000])
+def test_event_rates(n):
+    table = _create_rate_table(n)
+    rates = _event_rates(table, 7, 0, 100, 'time')
+    _assert_rates_equal(rates, [
+        table.event_rate(7, start=0, end=100, timecolumn='time')])
+
+
+@pytest.mark.parametrize('n', [0, 1000])
+@pytest.mark.parametrize('op, bins', [
+    ('>=', [10, 20]),
+    ('<', [5]),
+    ('in', [0, 10, 30]),
+    ('>=', [(0, 10), (20, 30)]),
+    (operator.ge, [10, 20]),
+])
+def test_binned_event_rates(n, op, bins):
+    table = _create_rate_table(n)
+    rates = _event_rates(table, 7, 0, 100, 'time', column='snr',
+                         bins=bins, operator=op)
+    _assert_rates_equal(rates, list(table.binned_event_rates(
+        7, 'snr', bins, operator=op, start=0, end=100,
+        timecolumn='time').values()))
+
+
+def test_binned_event_rates_invalid_operator():
+    # 'in' is only understood with flat bin edges
+    table = _create_rate_table(10)
+    with pytest.raises(KeyError):
+        _event_rates(table, 7, 0, 100, 'time', column='snr',
+                     bins=[(0, 10), (20, 30)], operator='in')
@@ -24,8 +24,11 @@ import os.path
 
 import pytest
 
-from .. import tabs
+from .. import (globalv, tabs, triggers)
 from ..plot import SummaryPlot
+from ..plot.triggers import TriggerDataPlot
+from ..state import SummaryState
+from .test_triggers import _create_table
 
 __author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
 
@@ -153,3 +156,26 @@ class TestPlotTab(TestTab):
             tab.set_layout([1, (1, 2, 1)])
         with pytest.warns(DeprecationWarning):
             tab.layout = [1]
+
+
+# -- data tab
+
+def test_data_tab_clears_segment_cache(tmpdir):
+    globalv.TRIGGERS = {}
+    globalv.WRITTEN_PLOTS = []
+    triggers.add_triggers(_create_table(0, 100), 'X1:TEST,testing')
+    state = SummaryState('Test', known=[(0, 100)], active=[(0, 100)])
+    tab = tabs.get_tab('default')('Test', mode='gps', start=0, end=100,
+                                  states=[state])
+    tab.add_plot(TriggerDataPlot(['X1:TEST'], 0, 100, state=state,
+                                 etg='testing', x='time', y='snr',
+                                 color=None, outdir=str(tmpdir)))
+
+    try:
+        tab.process_state(state)
+        assert tmpdir.join(os.path.basename(tab.plots[0].outputfile)).check()
+        assert not triggers._SEGMENT_CACHE
+    finally:  # clean up
+        globalv.TRIGGERS = {}
+        globalv.WRITTEN_PLOTS = []
+        triggers.clear_segment_cache()
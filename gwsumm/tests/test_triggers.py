@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) Duncan Macleod (2013)
+#
+# This file is part of GWSumm.
+#
+# GWSumm is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GWSumm is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GWSumm.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for `gwsumm.triggers`
+
+"""
+
+from numpy import arange
+
+from gwpy.table import EventTable
+from gwpy.segments import (Segment, SegmentList)
+
+from .. import (globalv, triggers)
+
+__author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
+
+
+def _create_table(start, end):
+    table = EventTable([arange(start, end) + .5, arange(start, end)],
+                       names=['time', 'snr'])
+    table.meta['timecolumn'] = 'time'
+    table.meta['segments'] = SegmentList([Segment(start, end)])
+    return table
+
+
+def test_get_triggers_in_segments():
+    globalv.TRIGGERS = {}
+    triggers.clear_segment_cache()
+    triggers.add_triggers(_create_table(0, 100), 'X1:TEST,testing')
+    segs = SegmentList([Segment(10, 20)])
+
+    try:
+        # check filtering and memoisation
+        t = triggers.get_triggers_in_segments('X1:TEST', 'testing', segs)
+        assert len(t) == 10
+        assert t['time'].min() == 10.5
+        assert triggers.get_triggers_in_segments(
+            'X1:TEST', 'testing', [(10, 20)]) is t
+        assert len(triggers._SEGMENT_CACHE) == 1
+
+        # check that adding new triggers evicts the superseded copies
+        triggers.add_triggers(_create_table(15, 30), 'X1:TEST,testing')
+        assert not triggers._SEGMENT_CACHE
+        t2 = triggers.get_triggers_in_segments('X1:TEST', 'testing', segs)
+        assert t2 is not t
+        assert len(t2) == 15
+
+        # check that the cache size is bounded, oldest first
+        size = triggers._SEGMENT_CACHE_SIZE
+        for i in range(size + 1):
+            triggers.get_triggers_in_segments(
+                'X1:TEST', 'testing', [(i, i + 1)])
+        assert len(triggers._SEGMENT_CACHE) == size
+        assert ('X1:TEST,testing', ((10., 20.),)) not in (
+            triggers._SEGMENT_CACHE)
+    finally:  # clean up
+        globalv.TRIGGERS = {}
+        triggers.clear_segment_cache()
@@ -20,6 +20,7 @@
 """
 
 import warnings
+from collections import OrderedDict
 from urllib.parse import urlparse
 
 from astropy.table import vstack as vstack_tables
@@ -106,6 +107,12 @@ for name in lsctables.TableByName:
     }
 
 
+# LRU cache of segment-filtered copies of globalv.TRIGGERS,
+# see get_triggers_in_segments
+_SEGMENT_CACHE = OrderedDict()
+_SEGMENT_CACHE_SIZE = 64
+
+
 def get_etg_table(etg):
     """Find which table should be used for the given etg
 
@@ -300,11 +307,61 @@ def get_triggers(channel, etg, segments, config=GWSummConfigParser(),
         return keep_in_segments(globalv.TRIGGERS[key], segments, etg)
 
 
+def get_triggers_in_segments(channel, etg, segments):
+    """Return the triggers held in memory for a channel within some segments
+
+    This is equivalent to ``get_triggers(..., query=False)``, but the
+    segment-filtered copy of the stored table is memoised on
+    ``(channel, etg, segments)`` so that several plots of the same channel
+    and state share one copy. At most ``_SEGMENT_CACHE_SIZE`` copies are
+    kept (least recently used are dropped first), all copies for a
+    channel are dropped when `add_triggers` stores new triggers for it,
+    and `~gwsumm.tabs.DataTab` clears the cache after each state's plots.
+
+    The returned table should be treated as read-only.
+    """
+    key = '%s,%s' % (str(channel), etg.lower())
+    if isinstance(segments, DataQualityFlag):
+        segments = segments.active
+    segments = SegmentList(segments)
+    cachekey = (key, tuple((float(s[0]), float(s[1])) for s in segments))
+    if key in globalv.TRIGGERS:
+        try:
+            table = _SEGMENT_CACHE[cachekey]
+        except KeyError:
+            pass
+        else:
+            _SEGMENT_CACHE.move_to_end(cachekey)
+            return table
+    table = get_triggers(channel, etg, segments, query=False)
+    _SEGMENT_CACHE[cachekey] = table
+    while len(_SEGMENT_CACHE) > _SEGMENT_CACHE_SIZE:
+        _SEGMENT_CACHE.popitem(last=False)
+    return table
+
+
+def clear_segment_cache(key=None):
+    """Drop cached segment-filtered copies made by `get_triggers_in_segments`
+
+    Parameters
+    ----------
+    key : `str`, optional
+        the trigger key (``'<channel>,<etg>'``) whose copies to drop,
+        default: drop all copies
+    """
+    if key is None:
+        _SEGMENT_CACHE.clear()
+        return
+    for cachekey in [k for k in _SEGMENT_CACHE if k[0] == key]:
+        del _SEGMENT_CACHE[cachekey]
+
+
 def add_triggers(table, key, segments=None):
     """Add a `EventTable` to the global memory cache
     """
     if segments is not None:
         table.meta['segments'] = segments
+    clear_segment_cache(key)
     try:
         old = globalv.TRIGGERS[key]
     except KeyError: